@@ -6,13 +6,37 @@ generation and polygon warping.
 """
 
 import sys
+import threading
 import numpy as np
 import matplotlib
 matplotlib.use("QtAgg")
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_svg import FigureCanvasSVG
+from matplotlib.lines import Line2D
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
 from scipy.spatial import Voronoi
-from shapely.geometry import Polygon, box, MultiPolygon
-from noise import pnoise2
+import shapely
+from shapely.geometry import box
+
+try:
+    from numba import get_num_threads, njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    # numba is optional: without it the noise kernels run as plain NumPy
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Held around every parallel (prange) kernel call. numba's plain workqueue
+# threading layer, used when neither TBB nor OpenMP is installed, aborts the
+# process if two threads launch parallel kernels at once, and the warp runs
+# on a pool thread while saving runs on the UI thread.
+_PARALLEL_LOCK = threading.RLock()
 
 try:
     from PyQt6 import QtWidgets, QtCore
@@ -24,118 +48,579 @@ except Exception:
     QtVersion = 5
 
 
+def _polygon_parts(geoms):
+    """Flatten an array of geometries into a list of valid, non-empty polygons.
+
+    Multi-part results and geometry collections (as produced by clipping or
+    `make_valid`) are split into their parts; anything that isn't a polygon
+    with positive area is dropped.
+    """
+    parts = shapely.get_parts(geoms)
+    keep = ((shapely.get_type_id(parts) == shapely.GeometryType.POLYGON) &
+            shapely.is_valid(parts) & (shapely.area(parts) > 0))
+    return list(parts[keep])
+
+
+def _clip_to_rect(polys, xmin, ymin, xmax, ymax):
+    """`shapely.clip_by_rect` for an array of geometries, skipping the ones
+    whose bounds already lie inside the rectangle (most interior cells)."""
+    bounds = shapely.bounds(polys)
+    outside = ~((bounds[:, 0] >= xmin) & (bounds[:, 1] >= ymin) &
+                (bounds[:, 2] <= xmax) & (bounds[:, 3] <= ymax))
+    if outside.any():
+        polys = polys.copy()
+        polys[outside] = shapely.clip_by_rect(polys[outside], xmin, ymin, xmax, ymax)
+    return polys
+
+
 def voronoi_polygons(vor, bbox=box(0, 0, 1, 1)):
-    regions = []
-    for region_index in vor.point_region:
-        region = vor.regions[region_index]
-        if -1 in region or len(region) == 0:
-            continue
-        try:
-            poly = Polygon(vor.vertices[region])
-        except ValueError:
-            continue
-        if not poly.is_valid:
-            poly = poly.buffer(0)
-            if not poly.is_valid or poly.is_empty:
-                continue
-        clipped_poly = poly.intersection(bbox)
-        if clipped_poly.is_empty:
-            continue
-        if isinstance(clipped_poly, Polygon):
-            if clipped_poly.is_valid and clipped_poly.area > 0:
-                regions.append(clipped_poly)
-        elif isinstance(clipped_poly, MultiPolygon):
-            for p in clipped_poly.geoms:
-                if p.is_valid and p.area > 0:
-                    regions.append(p)
-    return regions
+    regions = [vor.regions[i] for i in vor.point_region]
+    regions = [r for r in regions if len(r) >= 3 and -1 not in r]
+    if not regions:
+        return []
+    # build every cell in one call from a flat vertex array plus the index
+    # of the ring each vertex belongs to
+    sizes = np.array([len(r) for r in regions])
+    coords = vor.vertices[np.concatenate(regions)]
+    # Voronoi cells are convex, so they need no validity check; only cells
+    # that collapsed to (near) zero area are dropped, using the shoelace
+    # formula over each ring
+    starts = np.cumsum(sizes) - sizes
+    nxt = np.arange(1, len(coords) + 1)
+    nxt[starts + sizes - 1] = starts
+    x, y = coords[:, 0], coords[:, 1]
+    area = 0.5 * np.abs(np.add.reduceat(x * y[nxt] - x[nxt] * y, starts))
+    keep = area > 1e-12
+    if not keep.any():
+        return []
+    coords = coords[np.repeat(keep, sizes)]
+    ring_index = np.repeat(np.arange(keep.sum()), sizes[keep])
+    polys = shapely.polygons(shapely.linearrings(coords, indices=ring_index))
+    return _polygon_parts(_clip_to_rect(polys, *bbox.bounds))
 
 
-def warp_vertices(poly, scale=0.05, freq=3.0, bbox=None):
-    """Warp polygon exterior vertices with Perlin noise.
+# Ken Perlin's reference permutation (the same table the `noise` package
+# uses), repeated so that `_PERM[a + j]` never needs wrapping.
+_PERM = np.tile(np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148,
+    247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+    57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68,
+    175, 74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111,
+    229, 122, 60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244,
+    102, 143, 54, 65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208,
+    89, 18, 169, 200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198,
+    173, 186, 3, 64, 52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118,
+    126, 255, 82, 85, 212, 207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28,
+    42, 223, 183, 170, 213, 119, 248, 152, 2, 44, 154, 163, 70, 221, 153,
+    101, 155, 167, 43, 172, 9, 129, 22, 39, 253, 19, 98, 108, 110, 79, 113,
+    224, 232, 178, 185, 112, 104, 218, 246, 97, 228, 251, 34, 242, 193,
+    238, 210, 144, 12, 191, 179, 162, 241, 81, 51, 145, 235, 249, 14, 239,
+    107, 49, 192, 214, 31, 181, 199, 106, 157, 184, 84, 204, 176, 115, 121,
+    50, 45, 127, 4, 150, 254, 138, 236, 205, 93, 222, 114, 67, 29, 24, 72,
+    243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+], dtype=np.uint8), 2)
 
-    Vertices that lie on the bbox boundary (if provided) are left clamped
-    to the boundary so they don't move inside the unit square. This helps
-    keep the same number of regions at the edges.
+# x/y components of the 16 gradient directions selected by `hash & 15`,
+# stored as float32 so the gradient dot products never leave float32.
+_GRAD = np.array([
+    (1, 1), (-1, 1), (1, -1), (-1, -1),
+    (1, 0), (-1, 0), (1, 0), (-1, 0),
+    (0, 1), (0, -1), (0, 1), (0, -1),
+    (1, 0), (-1, 0), (0, -1), (0, 1),
+], dtype=np.float32)
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _perlin2_point(x, y):
+    """Single-octave 2D Perlin noise at float32 `x`, `y`.
+
+    Compiled by numba this is the scalar body of `_fbm2_xy`'s loop; without
+    numba the same code runs on whole float32 arrays.
+    """
+    xf = np.floor(x)
+    yf = np.floor(y)
+    i = np.int32(xf) & 255
+    j = np.int32(yf) & 255
+    x = x - xf
+    y = y - yf
+    fx = x * x * x * (x * (x * 6 - 15) + 10)
+    fy = y * y * y * (y * (y * 6 - 15) + 10)
+
+    a = _PERM[i]
+    b = _PERM[i + 1]
+    h00 = _PERM[_PERM[a + j]] & 15
+    h10 = _PERM[_PERM[b + j]] & 15
+    h01 = _PERM[_PERM[a + j + 1]] & 15
+    h11 = _PERM[_PERM[b + j + 1]] & 15
+    g00 = x * _GRAD[h00, 0] + y * _GRAD[h00, 1]
+    g10 = (x - 1) * _GRAD[h10, 0] + y * _GRAD[h10, 1]
+    g01 = x * _GRAD[h01, 0] + (y - 1) * _GRAD[h01, 1]
+    g11 = (x - 1) * _GRAD[h11, 0] + (y - 1) * _GRAD[h11, 1]
+
+    lo = g00 + fx * (g10 - g00)
+    hi = g01 + fx * (g11 - g01)
+    return lo + fy * (hi - lo)
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _fbm2_point(x, y, octaves=2, persistence=0.5, lacunarity=2.0):
+    """Fractal sum of `_perlin2_point` octaves, normalised like `noise.pnoise2`.
+
+    Takes float32 scalars under numba or float32 arrays without it. The
+    octave frequency and amplitude are float32 too, so the whole sum stays
+    in float32. A single octave skips the sum.
     """
-    if poly is None or poly.is_empty or not hasattr(poly, 'exterior'):
-        return None
-    coords = np.array(poly.exterior.coords)
-    warped = []
-    # bbox bounds
+    if octaves == 1:
+        return _perlin2_point(x, y)
+    persistence = np.float32(persistence)
+    lacunarity = np.float32(lacunarity)
+    total = np.float32(0.0)
+    freq = np.float32(1.0)
+    amp = np.float32(1.0)
+    norm = np.float32(0.0)
+    for _ in range(octaves):
+        total += _perlin2_point(x * freq, y * freq) * amp
+        norm += amp
+        freq *= lacunarity
+        amp *= persistence
+    return total / norm
+
+
+@njit(cache=True, nogil=True, parallel=True, fastmath=True)
+def _fbm2_xy(x, y, shift, octaves, out):
+    """Both noise offsets of every point in one parallel pass, into `out`.
+
+    `out[k, 0]` is `_fbm2_point` at `(x[k], y[k])` and `out[k, 1]` at the same
+    point shifted by `shift`; each point is rounded to float32 first. Doing
+    the two lookups back to back keeps the permutation table in cache and
+    makes no temporaries.
+    """
+    for k in prange(x.size):
+        out[k, 0] = _fbm2_point(np.float32(x[k]), np.float32(y[k]), octaves, 0.5, 2.0)
+        out[k, 1] = _fbm2_point(np.float32(x[k] + shift), np.float32(y[k] + shift),
+                                octaves, 0.5, 2.0)
+
+
+def _bbox_bounds(bbox):
+    """Bounds of `bbox`, falling back to the unit square."""
     if bbox is not None:
         try:
-            minx, miny, maxx, maxy = bbox.bounds
+            return bbox.bounds
         except Exception:
-            minx, miny, maxx, maxy = 0.0, 0.0, 1.0, 1.0
+            pass
+    return 0.0, 0.0, 1.0, 1.0
+
+
+def noise_offsets(coords, freq=3.0, octaves=2, out=None, work=None):
+    """Raw Perlin offsets `(dx, dy)` of each vertex, before scaling.
+
+    A warp moves every vertex by `scale * noise_offsets(coords, freq)`, so
+    while `freq` stays the same the result can be reused for any `scale`.
+    Returns an (N, 2) float32 array, written into `out` when one is given.
+    `work` is an optional (N, 2) float64 scratch array for the scaled
+    sample points; with both buffers the numba path allocates nothing.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    if out is None:
+        out = np.empty((len(coords), 2), dtype=np.float32)
+    scaled = np.multiply(coords, freq, out=work)
+    # noise is evaluated in float32, matching the old `pnoise2` calls; the
+    # dy sample point `(x + 10) * freq` is just the scaled point shifted
+    if HAVE_NUMBA:
+        with _PARALLEL_LOCK:
+            _fbm2_xy(scaled[:, 0], scaled[:, 1], 10 * freq, octaves, out)
     else:
-        minx, miny, maxx, maxy = 0.0, 0.0, 1.0, 1.0
+        xs, ys = scaled.astype(np.float32).T
+        out[:, 0] = _fbm2_point(xs, ys, octaves, 0.5, 2.0)
+        xs, ys = (scaled + 10 * freq).astype(np.float32).T
+        out[:, 1] = _fbm2_point(xs, ys, octaves, 0.5, 2.0)
+    return out
+
+
+def warp_coords(coords, scale=0.05, freq=3.0, bbox=None, octaves=2, noise=None):
+    """Warp an (N, 2) array of vertices with Perlin noise.
+
+    Vertices that lie on the bbox boundary (if provided) are left clamped
+    to the boundary so they don't move inside the unit square. This helps
+    keep the same number of regions at the edges. `octaves=1` evaluates a
+    single noise octave, which is about half the work of the default two.
+    `noise` may pass precomputed `noise_offsets(coords, freq, octaves)`.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    x = coords[:, 0]
+    y = coords[:, 1]
+    minx, miny, maxx, maxy = _bbox_bounds(bbox)
     atol = 1e-8
-    for x, y in coords:
-        # if the vertex is on the bbox boundary, keep it clamped to that edge
-        on_left = abs(x - minx) <= atol
-        on_right = abs(x - maxx) <= atol
-        on_bottom = abs(y - miny) <= atol
-        on_top = abs(y - maxy) <= atol
-        if on_left or on_right or on_bottom or on_top:
-            # clamp coordinates exactly to the bbox edge to avoid drifting inward
-            cx = min(max(x, minx), maxx)
-            cy = min(max(y, miny), maxy)
-            warped.append([cx, cy])
+    # vertices on the bbox boundary stay clamped to that edge
+    on_edge = ((np.abs(x - minx) <= atol) | (np.abs(x - maxx) <= atol) |
+               (np.abs(y - miny) <= atol) | (np.abs(y - maxy) <= atol))
+    if noise is None:
+        noise = noise_offsets(coords, freq=freq, octaves=octaves)
+
+    warped = np.empty_like(coords)
+    warped[:, 0] = np.where(on_edge, np.clip(x, minx, maxx), x + noise[:, 0] * scale)
+    warped[:, 1] = np.where(on_edge, np.clip(y, miny, maxy), y + noise[:, 1] * scale)
+    return warped
+
+
+def stack_rings(polys):
+    """Flatten the exterior rings of `polys` into one (N, 2) vertex array.
+
+    Returns `(coords, offsets)` where `coords[offsets[k]:offsets[k + 1]]`
+    is the closed exterior ring of the k-th polygon. The coordinates are
+    read through shapely's vectorized API rather than per-polygon
+    `exterior.coords` access.
+    """
+    coords, ring_index = shapely.get_coordinates(
+        shapely.get_exterior_ring(polys), return_index=True)
+    offsets = np.searchsorted(ring_index, np.arange(len(polys) + 1))
+    return coords, offsets
+
+
+def warp_rings(coords, offsets, scale=0.05, freq=3.0, bbox=None, octaves=2, noise=None):
+    """Warp stacked rings (see `stack_rings`) and clip them to `bbox`.
+
+    The noise for every vertex is evaluated in one pass over `coords`
+    (or taken from `noise`, see `noise_offsets`); shapely is only used
+    afterwards to rebuild, repair and clip the polygons, each in a single
+    vectorized call. The clipped polygons are returned stacked the same
+    way, as `(coords, offsets)`.
+    """
+    if len(offsets) < 2:
+        return np.empty((0, 2)), np.zeros(1, dtype=np.intp)
+    warped = warp_coords(coords, scale=scale, freq=freq, bbox=bbox, octaves=octaves,
+                         noise=noise)
+    ring_index = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    polys = shapely.polygons(shapely.linearrings(warped, indices=ring_index))
+    invalid = ~shapely.is_valid(polys)
+    if invalid.any():
+        polys[invalid] = shapely.make_valid(polys[invalid])
+    if bbox is not None:
+        polys = _clip_to_rect(polys, *bbox.bounds)
+    return stack_rings(_polygon_parts(polys))
+
+
+def _clip_half_plane(coords, offsets, axis, bound, keep_above):
+    """One Sutherland-Hodgman pass over open stacked rings.
+
+    Keeps the part of every ring on one side of the line `coord[axis] ==
+    bound`. Each edge `prev -> cur` emits the crossing point (if it crosses
+    the line) followed by `cur` (if `cur` is inside), so output positions
+    follow from a cumulative sum over all rings at once.
+    """
+    n = len(coords)
+    if n == 0:
+        return coords, offsets
+    starts = offsets[:-1]
+    ends = offsets[1:]
+    nonempty = ends > starts
+    prev = np.arange(-1, n - 1)
+    prev[starts[nonempty]] = ends[nonempty] - 1
+    v = coords[:, axis]
+    inside = v >= bound if keep_above else v <= bound
+    crossing = inside != inside[prev]
+    counts = inside.astype(np.intp) + crossing
+    emitted = np.concatenate(([0], np.cumsum(counts)))
+    out = np.empty((emitted[-1], 2))
+
+    cur = coords[crossing]
+    before = coords[prev[crossing]]
+    t = (bound - before[:, axis]) / (cur[:, axis] - before[:, axis])
+    hits = before + t[:, None] * (cur - before)
+    hits[:, axis] = bound
+    out[emitted[:-1][crossing]] = hits
+    out[emitted[1:][inside] - 1] = coords[inside]
+    return out, emitted[offsets]
+
+
+def clip_rings_to_rect(coords, offsets, xmin, ymin, xmax, ymax):
+    """Clip stacked closed rings to an axis-aligned rectangle.
+
+    Runs Sutherland-Hodgman against the four rectangle edges directly on
+    the `(coords, offsets)` arrays (see `stack_rings`), without building
+    shapely geometries. A ring that the rectangle cuts into several pieces
+    comes back as one ring joined along the rectangle edge, which draws the
+    same outline. Rings left with fewer than three vertices are dropped;
+    the result is stacked and closed like the input.
+    """
+    if len(coords) == 0:
+        return coords, offsets
+    # drop each ring's closing vertex for the clipping passes
+    is_open = np.ones(len(coords), dtype=bool)
+    is_open[offsets[1:][offsets[1:] > offsets[:-1]] - 1] = False
+    coords = coords[is_open]
+    sizes = np.diff(np.concatenate(([0], np.cumsum(is_open)))[offsets])
+
+    # rings entirely inside the rectangle pass through untouched
+    ring_of = np.repeat(np.arange(len(sizes)), sizes)
+    sticks_out = np.zeros(len(sizes), dtype=bool)
+    sticks_out[ring_of[(coords[:, 0] < xmin) | (coords[:, 0] > xmax) |
+                       (coords[:, 1] < ymin) | (coords[:, 1] > ymax)]] = True
+    to_clip = sticks_out[ring_of]
+    clipped = coords[to_clip]
+    offsets = np.concatenate(([0], np.cumsum(sizes[sticks_out])))
+    for axis, bound, keep_above in ((0, xmin, True), (0, xmax, False),
+                                    (1, ymin, True), (1, ymax, False)):
+        clipped, offsets = _clip_half_plane(clipped, offsets, axis, bound, keep_above)
+    coords = np.concatenate((coords[~to_clip], clipped))
+    sizes = np.concatenate((sizes[~sticks_out], np.diff(offsets)))
+
+    keep = sizes >= 3
+    coords = coords[np.repeat(keep, sizes)]
+    sizes = sizes[keep]
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    # close the rings again by repeating each first vertex at the end
+    coords = np.insert(coords, offsets[1:], coords[offsets[:-1]], axis=0)
+    offsets = offsets + np.arange(len(offsets))
+    return coords, offsets
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _clip_ring_pass(sx, sy, n, dx, dy, axis, bound, keep_above):
+    """Sutherland-Hodgman pass of one open ring `sx/sy[:n]` into `dx/dy`."""
+    m = 0
+    px = sx[n - 1]
+    py = sy[n - 1]
+    pv = px if axis == 0 else py
+    p_in = pv >= bound if keep_above else pv <= bound
+    for i in range(n):
+        cx = sx[i]
+        cy = sy[i]
+        cv = cx if axis == 0 else cy
+        c_in = cv >= bound if keep_above else cv <= bound
+        if c_in != p_in:
+            t = (bound - pv) / (cv - pv)
+            if axis == 0:
+                dx[m] = bound
+                dy[m] = py + t * (cy - py)
+            else:
+                dx[m] = px + t * (cx - px)
+                dy[m] = bound
+            m += 1
+        if c_in:
+            dx[m] = cx
+            dy[m] = cy
+            m += 1
+        px = cx
+        py = cy
+        pv = cv
+        p_in = c_in
+    return m
+
+
+@njit(cache=True, nogil=True, parallel=True, fastmath=True)
+def _warp_and_clip(coords, offsets, noise, scale, xmin, ymin, xmax, ymax):
+    """Fused warp + rectangle clip of stacked closed rings, one ring per thread.
+
+    `noise` holds the unscaled per-vertex offsets (see `noise_offsets`).
+    Each ring is warped and clipped in private scratch buffers sized for
+    the worst case (a clip pass can at most double a ring), written to its
+    own slot of a padded output and finally compacted.
+    """
+    n_rings = len(offsets) - 1
+    cap = np.zeros(n_rings + 1, dtype=np.int64)
+    for k in range(n_rings):
+        cap[k + 1] = cap[k] + 16 * (offsets[k + 1] - offsets[k]) + 1
+    padded = np.empty((cap[n_rings], 2))
+    counts = np.zeros(n_rings, dtype=np.int64)
+    atol = 1e-8
+    for k in prange(n_rings):
+        start = offsets[k]
+        n = offsets[k + 1] - start - 1  # skip the closing vertex
+        if n < 3:
+            continue
+        ax = np.empty(16 * n)
+        ay = np.empty(16 * n)
+        bx = np.empty(16 * n)
+        by = np.empty(16 * n)
+        inside = True
+        for i in range(n):
+            x = coords[start + i, 0]
+            y = coords[start + i, 1]
+            if (abs(x - xmin) <= atol or abs(x - xmax) <= atol or
+                    abs(y - ymin) <= atol or abs(y - ymax) <= atol):
+                ax[i] = min(max(x, xmin), xmax)
+                ay[i] = min(max(y, ymin), ymax)
+            else:
+                ax[i] = x + noise[start + i, 0] * scale
+                ay[i] = y + noise[start + i, 1] * scale
+                if ax[i] < xmin or ax[i] > xmax or ay[i] < ymin or ay[i] > ymax:
+                    inside = False
+        m = n
+        if not inside:
+            m = _clip_ring_pass(ax, ay, n, bx, by, 0, xmin, True)
+            m = _clip_ring_pass(bx, by, m, ax, ay, 0, xmax, False) if m else 0
+            m = _clip_ring_pass(ax, ay, m, bx, by, 1, ymin, True) if m else 0
+            m = _clip_ring_pass(bx, by, m, ax, ay, 1, ymax, False) if m else 0
+        if m < 3:
             continue
+        base = cap[k]
+        for i in range(m):
+            padded[base + i, 0] = ax[i]
+            padded[base + i, 1] = ay[i]
+        padded[base + m, 0] = ax[0]
+        padded[base + m, 1] = ay[0]
+        counts[k] = m + 1
 
-        dx = pnoise2(x * freq, y * freq, octaves=2, persistence=0.5, lacunarity=2.0)
-        dy = pnoise2((x + 10) * freq, (y + 10) * freq, octaves=2, persistence=0.5, lacunarity=2.0)
-        warped.append([x + dx * scale, y + dy * scale])
-    try:
-        p = Polygon(warped)
-        if not p.is_valid:
-            p = p.buffer(0)
-        return p
-    except Exception:
-        return None
+    kept = 0
+    for k in range(n_rings):
+        if counts[k]:
+            kept += 1
+    new_offsets = np.zeros(kept + 1, dtype=np.int64)
+    out = np.empty((counts.sum(), 2))
+    r = 0
+    for k in range(n_rings):
+        if counts[k]:
+            out[new_offsets[r]:new_offsets[r] + counts[k]] = padded[cap[k]:cap[k] + counts[k]]
+            new_offsets[r + 1] = new_offsets[r] + counts[k]
+            r += 1
+    return out, new_offsets
+
+
+def warp_and_clip_rings(coords, offsets, scale=0.05, freq=3.0, bbox=None, octaves=2,
+                        noise=None):
+    """Warp stacked rings and clip them to `bbox` (the unit square by default).
+
+    Equivalent to `warp_coords` followed by `clip_rings_to_rect`; with
+    numba installed both steps run fused in a compiled kernel that works
+    on the rings in parallel. `noise` may pass precomputed
+    `noise_offsets(coords, freq, octaves)`.
+    """
+    minx, miny, maxx, maxy = _bbox_bounds(bbox)
+    if noise is None:
+        noise = noise_offsets(coords, freq=freq, octaves=octaves)
+    if HAVE_NUMBA and len(coords):
+        coords = np.ascontiguousarray(coords, dtype=np.float64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        with _PARALLEL_LOCK:
+            return _warp_and_clip(coords, offsets, noise, float(scale),
+                                  minx, miny, maxx, maxy)
+    warped = warp_coords(coords, scale=scale, bbox=bbox, noise=noise)
+    return clip_rings_to_rect(warped, offsets, minx, miny, maxx, maxy)
+
+
+def nan_separated(coords, offsets):
+    """Join stacked rings into one (N + rings - 1, 2) polyline array.
+
+    A NaN row is put between consecutive rings; Matplotlib breaks a line at
+    NaNs, so a single Line2D draws every ring as its own outline.
+    """
+    return np.insert(coords, offsets[1:-1], np.nan, axis=0)
+
+
+def _outline_line(coords, offsets, linewidth=0.8):
+    """Build one Line2D outlining every stacked ring.
+
+    A single line is drawn as one artist and one path, which is far cheaper
+    than a separate `ax.plot` line per polygon (or even one collection
+    path per ring) once there are many cells. The rings are already closed.
+    """
+    flat = nan_separated(coords, offsets)
+    return Line2D(flat[:, 0], flat[:, 1], color='k', linewidth=linewidth)
 
 
-def plot_polygons(ax, polys, title, linewidth=0.8):
-    ax.cla()
+def plot_polygons(ax, coords, offsets, title, linewidth=0.8):
+    """Set up a fresh `ax` and outline the stacked rings on it.
+
+    Returns the Line2D so callers can later swap its rings with `set_data`
+    (see `nan_separated`) instead of clearing and re-plotting the axes.
+    """
     ax.set_aspect('equal')
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
     ax.set_title(title)
     ax.set_xticks([])
     ax.set_yticks([])
-    for poly in polys:
-        if poly is None or poly.is_empty or not hasattr(poly, 'exterior'):
-            continue
-        x, y = poly.exterior.xy
-        ax.plot(x, y, 'k-', linewidth=linewidth)
+    return ax.add_line(_outline_line(coords, offsets, linewidth=linewidth))
 
 
-def _save_single_svg(polys, title, out_path, fmt='svg', size=(6, 6), linewidth=0.8):
-    """Render polygons onto a single-axis figure and save as SVG.
+def _save_single_svg(coords, offsets, title, out_path, fmt='svg', size=(6, 6), linewidth=0.8):
+    """Render stacked rings onto a single-axis figure and save as SVG.
 
     This creates a temporary Matplotlib figure so we don't disturb the
     embedded GUI figure, renders the polygons with the same axis limits
-    and aspect, saves to `out_path` (string or Path), and closes the
-    temporary figure to free resources.
+    and aspect and saves to `out_path` (string or Path). The figure is
+    never registered with pyplot, so it is freed as soon as it goes out
+    of scope. SVG output goes straight through the SVG backend; raster
+    formats use Agg.
     """
-    fig, ax = plt.subplots(1, 1, figsize=size)
-    ax.set_aspect('equal')
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.set_title(title)
-    ax.set_xticks([])
-    ax.set_yticks([])
-    for poly in polys:
-        if poly is None or poly.is_empty or not hasattr(poly, 'exterior'):
-            continue
-        x, y = poly.exterior.xy
-        ax.plot(x, y, 'k-', linewidth=linewidth)
-    try:
-        actual_fmt = 'jpeg' if fmt == 'jpg' else fmt
-        fig.savefig(str(out_path), format=actual_fmt, bbox_inches='tight')
-    finally:
-        plt.close(fig)
+    fig = Figure(figsize=size)
+    canvas = FigureCanvasSVG(fig) if fmt == 'svg' else FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    plot_polygons(ax, coords, offsets, title, linewidth=linewidth)
+    actual_fmt = 'jpeg' if fmt == 'jpg' else fmt
+    canvas.print_figure(str(out_path), format=actual_fmt, bbox_inches='tight')
+
+
+# Sites placed around the unit square so that every cell of a random site
+# inside it is bounded.
+_BORDER_POINTS = np.array(
+    [[x, y] for x in (-1, 0, 1, 2) for y in (-1, 2)] +
+    [[x, y] for x in (-1, 2) for y in (0, 1)],
+    dtype=np.float64,
+)
+
+
+# Douglas-Peucker tolerance for the coarser cells shown while a slider is
+# being dragged (about 2 px at the default figure size).
+_DRAG_SIMPLIFY_TOLERANCE = 0.002
+# Noise octaves for the drag preview; the final (released) warp uses two.
+_DRAG_OCTAVES = 1
+
+
+class _WarpSignals(QtCore.QObject):
+    # QRunnable is not a QObject, so results are sent back through this
+    finished = QtCore.pyqtSignal(object)
+
+
+class WarpTask(QtCore.QRunnable):
+    """Noise and warp of stacked rings, run on a thread pool.
+
+    `noise` is reused when given, otherwise it is computed into `noise_buf`
+    using the `work` scratch array (see `noise_offsets`). The result is
+    emitted as `(key, noise, warped, scale)` through `signals.finished`,
+    which Qt delivers on the UI thread; `warped` is the warped rings as one
+    `nan_separated` array, or None if the warp failed. The numba kernels
+    release the GIL while they run.
+    """
+
+    def __init__(self, signals, key, coords, offsets, scale, freq, octaves, bbox,
+                 noise=None, noise_buf=None, work=None):
+        super().__init__()
+        self.signals = signals
+        self.key = key
+        self.coords = coords
+        self.offsets = offsets
+        self.scale = scale
+        self.freq = freq
+        self.octaves = octaves
+        self.bbox = bbox
+        self.noise = noise
+        self.noise_buf = noise_buf
+        self.work = work
+
+    def run(self):
+        noise = warped = None
+        try:
+            noise = self.noise
+            if noise is None:
+                noise = noise_offsets(self.coords, freq=self.freq, octaves=self.octaves,
+                                      out=self.noise_buf, work=self.work)
+            # the outlines only need clipping to the box, which is done directly
+            # on the vertex arrays; shapely's repair/clip runs only when saving
+            warped, offsets = warp_and_clip_rings(self.coords, self.offsets,
+                                                  scale=self.scale, bbox=self.bbox,
+                                                  noise=noise)
+            warped = nan_separated(warped, offsets)
+        except Exception as e:
+            warped = None
+            print(f"Error warping cells: {e}")
+        try:
+            self.signals.finished.emit((self.key, noise, warped, self.scale))
+        except RuntimeError:
+            # the widget was torn down while this warp was running
+            pass
 
 
 class VoronoiWidget(QtWidgets.QWidget):
@@ -160,10 +645,30 @@ class VoronoiWidget(QtWidgets.QWidget):
         idx = self.format_combo.findText('jpg')
         if idx >= 0:
             self.format_combo.setCurrentIndex(idx)
+        # site buffer reused by every regeneration: the fixed border sites
+        # are written once at the front, random sites are drawn after them
+        self._sites = np.empty((len(_BORDER_POINTS) + self.npoints_spin.maximum(), 2))
+        self._sites[:len(_BORDER_POINTS)] = _BORDER_POINTS
         self.points = None
         self.vor = None
+        # (seed, npoints) that self.vor was built for; see regenerate_points
+        self._vor_key = None
         self.polys = []
-        self.figure, self.axes = plt.subplots(1, 2, figsize=(8, 5))
+        # exterior rings of self.polys stacked into one array, so warping
+        # and drawing never touch the shapely objects (see stack_rings)
+        self._coords = np.empty((0, 2))
+        self._offsets = np.zeros(1, dtype=np.intp)
+        # simplified copy of the rings warped while a slider is being dragged
+        self._drag_coords = self._coords
+        self._drag_offsets = self._offsets
+        self._dragging = False
+        # unscaled noise offsets of the rings being warped; only a change of
+        # freq (or of the ring set) needs them recomputed
+        self._noise = None
+        self._noise_key = None
+        # a plain Figure owned by the Qt canvas, kept out of pyplot's registry
+        self.figure = Figure(figsize=(8, 5))
+        self.axes = self.figure.subplots(1, 2)
         self.canvas = FigureCanvas(self.figure)
         if QtVersion == 6:
             orient = QtCore.Qt.Orientation.Horizontal
@@ -214,15 +719,48 @@ class VoronoiWidget(QtWidgets.QWidget):
         self.setLayout(layout)
         self.scale_slider.valueChanged.connect(self.on_slider_change)
         self.freq_slider.valueChanged.connect(self.on_slider_change)
+        for slider in (self.scale_slider, self.freq_slider):
+            slider.sliderPressed.connect(self.on_slider_pressed)
+            slider.sliderReleased.connect(self.on_slider_released)
         # update on linewidth change as well
         try:
-            self.linewidth_spin.valueChanged.connect(self.update_plot)
+            self.linewidth_spin.valueChanged.connect(self.redraw)
         except Exception:
             pass
+        # coalesce bursts of slider events into one redraw per ~frame
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self.update_plot)
+        _start_numba_threads()
+        if HAVE_NUMBA:
+            # compile in the background (after numba's threads are started
+            # here) so the first slider move isn't a stall
+            threading.Thread(target=_warm_up_kernels, daemon=True).start()
+        # warps run on the pool one at a time; values that change meanwhile
+        # are picked up when the running warp comes back
+        self._warp_signals = _WarpSignals()
+        self._warp_signals.finished.connect(self._apply_warped)
+        self._warp_busy = False
+        self._warp_pending = False
+        # bumped whenever the cells change, to drop warps of the old ones
+        self._generation = 0
         self.refresh_btn.clicked.connect(self.on_refresh)
         self.save_btn.clicked.connect(self.on_save)
+        # Both axes are set up once; updates only swap line data
+        # and title text. Slider moves only change the warped cells and their
+        # title, so those two artists are animated and blitted over a cached
+        # background; a full draw (startup, refresh, resize) recaptures it.
+        self._orig_line = plot_polygons(self.axes[0], self._coords, self._offsets,
+                                        "Original Voronoi")
+        self._warp_line = plot_polygons(self.axes[1], self._coords, self._offsets, "Warped")
+        self._warp_title = self.axes[1].title
+        self._warp_line.set_animated(True)
+        self._warp_title.set_animated(True)
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.regenerate_points()
-        self.update_plot()
+        self.redraw()
         self.on_slider_change(0)
 
     def on_slider_change(self, value):
@@ -230,53 +768,133 @@ class VoronoiWidget(QtWidgets.QWidget):
         freq = self.freq_slider.value() / 100.0
         self.scale_label.setText(f"Scale: {scale:.3f}")
         self.freq_label.setText(f"Freq: {freq:.2f}")
+        self._update_timer.start()
+
+    def on_slider_pressed(self):
+        self._dragging = True
+
+    def on_slider_released(self):
+        # redraw at full detail once the drag is over
+        self._dragging = False
+        self._update_timer.stop()
         self.update_plot()
 
     def update_plot(self):
+        if self._warp_busy:
+            self._warp_pending = True
+            return
         scale = self.scale_slider.value() / 1000.0
         freq = self.freq_slider.value() / 100.0
-        warped_polys = []
-        for poly in self.polys:
-            try:
-                warped = warp_vertices(poly, scale=scale, freq=freq, bbox=self.bbox)
-                if warped:
-                    warped = warped.intersection(self.bbox)
-                    if not warped.is_valid:
-                        warped = warped.buffer(0)
-                    if warped.is_empty:
-                        continue
-                    if isinstance(warped, Polygon):
-                        warped_polys.append(warped)
-                    elif isinstance(warped, MultiPolygon):
-                        warped_polys.extend(p for p in warped.geoms if p.is_valid and p.area > 0)
-            except Exception:
-                continue
+        if self._dragging:
+            coords, offsets = self._drag_coords, self._drag_offsets
+            octaves = _DRAG_OCTAVES
+        else:
+            coords, offsets = self._coords, self._offsets
+            octaves = 2
+        noise_key = (freq, self._dragging)
+        noise = buf = work = None
+        if noise_key == self._noise_key:
+            noise = self._noise
+        else:
+            if self._dragging:
+                buf, work = self._drag_noise_buf, self._drag_noise_work
+            else:
+                buf, work = self._noise_buf, self._noise_work
+            # the buffers are about to be overwritten off-thread
+            self._noise_key = None
+        self._warp_busy = True
+        QtCore.QThreadPool.globalInstance().start(
+            WarpTask(self._warp_signals, (self._generation,) + noise_key, coords, offsets,
+                     scale, freq, octaves, self.bbox, noise=noise, noise_buf=buf,
+                     work=work))
+
+    def _apply_warped(self, result):
+        (generation, freq, dragging), noise, warped, scale = result
+        self._warp_busy = False
+        if generation == self._generation and warped is not None:
+            self._noise = noise
+            self._noise_key = (freq, dragging)
+            self._warp_line.set_data(warped[:, 0], warped[:, 1])
+            self._warp_title.set_text(f"Warped (s={scale:.3f}, f={freq:.2f})")
+            self._blit()
+        if self._warp_pending:
+            self._warp_pending = False
+            self.update_plot()
+
+    def redraw(self):
+        """Refresh the original cells and line width, then do a full draw."""
         lw = float(self.linewidth_spin.value()) if hasattr(self, 'linewidth_spin') else 0.8
-        plot_polygons(self.axes[0], self.polys, "Original Voronoi", linewidth=lw)
-        plot_polygons(self.axes[1], warped_polys, f"Warped (s={scale:.3f}, f={freq:.2f})", linewidth=lw)
-        self.canvas.draw()
+        flat = nan_separated(self._coords, self._offsets)
+        self._orig_line.set_data(flat[:, 0], flat[:, 1])
+        self._orig_line.set_linewidth(lw)
+        self._warp_line.set_linewidth(lw)
+        # the original panel is part of the blit background: drop it
+        self._background = None
+        self.update_plot()
+
+    def _on_draw(self, event):
+        # a full draw skips animated artists: cache what it rendered as the
+        # blit background, then paint the animated artists on top
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        self.axes[1].draw_artist(self._warp_line)
+        self.axes[1].draw_artist(self._warp_title)
+
+    def _blit(self):
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        # only the warped panel changes; its title sits above the axes, so
+        # blit the column from the bottom of the axes to the figure top
+        ax_box = self.axes[1].bbox
+        self.canvas.blit(Bbox.from_extents(ax_box.x0, ax_box.y0,
+                                           ax_box.x1, self.figure.bbox.y1))
 
     def regenerate_points(self):
         seed = int(self.seed_spin.value())
         n = int(self.npoints_spin.value())
-        rng = np.random.RandomState(seed)
-        self.points = rng.rand(n, 2)
-        border_points = np.array(
-            [[x, y] for x in [-1, 0, 1, 2] for y in [-1, 2]] +
-            [[x, y] for x in [-1, 2] for y in [0, 1]]
-        )
-        all_points = np.vstack([self.points, border_points])
+        rng = np.random.default_rng(seed)
+        nb = len(_BORDER_POINTS)
+        # the generator yields the same leading points for a given seed
+        # whatever n is, so growing n with the same seed only appends sites
+        rng.random((n, 2), out=self._sites[nb:nb + n])
+        self.points = self._sites[nb:nb + n]
+        old_seed, old_n = self._vor_key or (None, 0)
         try:
-            self.vor = Voronoi(all_points)
+            if seed == old_seed and n >= old_n:
+                if n > old_n:
+                    self.vor.add_points(self._sites[nb + old_n:nb + n])
+            else:
+                # qhull copies its input, so passing a view of the buffer is safe
+                self.vor = Voronoi(self._sites[:nb + n], incremental=True)
+            self._vor_key = (seed, n)
         except Exception as e:
+            self._vor_key = None
             print(f"Error creating Voronoi: {e}")
             QtWidgets.QMessageBox.critical(self, "Voronoi Error", f"Failed to generate Voronoi diagram:\n{e}")
             return
         self.polys = voronoi_polygons(self.vor, bbox=self.bbox)
+        self._coords, self._offsets = stack_rings(self.polys)
+        simplified = shapely.simplify(self.polys, _DRAG_SIMPLIFY_TOLERANCE,
+                                      preserve_topology=False)
+        simplified = simplified[~shapely.is_empty(simplified)]
+        self._drag_coords, self._drag_offsets = stack_rings(simplified)
+        # noise is recomputed into these on every frequency change, with the
+        # scaled sample points in the matching work array
+        self._noise_buf = np.empty((len(self._coords), 2), dtype=np.float32)
+        self._drag_noise_buf = np.empty((len(self._drag_coords), 2), dtype=np.float32)
+        self._noise_work = np.empty_like(self._coords)
+        self._drag_noise_work = np.empty_like(self._drag_coords)
+        self._noise_key = None
+        self._generation += 1
 
     def on_refresh(self):
         self.regenerate_points()
-        self.update_plot()
+        self.redraw()
 
     def on_save(self):
         # Build timestamped save directory next to this script
@@ -299,22 +917,10 @@ class VoronoiWidget(QtWidgets.QWidget):
         # compute current warped polygons using present slider settings
         scale = self.scale_slider.value() / 1000.0
         freq = self.freq_slider.value() / 100.0
-        warped_polys = []
-        for poly in self.polys:
-            try:
-                warped = warp_vertices(poly, scale=scale, freq=freq, bbox=self.bbox)
-                if warped:
-                    warped = warped.intersection(self.bbox)
-                    if not warped.is_valid:
-                        warped = warped.buffer(0)
-                    if warped.is_empty:
-                        continue
-                    if isinstance(warped, Polygon):
-                        warped_polys.append(warped)
-                    elif isinstance(warped, MultiPolygon):
-                        warped_polys.extend(p for p in warped.geoms if p.is_valid and p.area > 0)
-            except Exception:
-                continue
+        # the full-detail noise cached by update_plot is reusable here
+        noise = self._noise if self._noise_key == (freq, False) else None
+        warped, warped_offsets = warp_rings(self._coords, self._offsets, scale=scale,
+                                            freq=freq, bbox=self.bbox, noise=noise)
 
         # Save original and warped separately using selected format
         fmt = 'svg'
@@ -327,8 +933,8 @@ class VoronoiWidget(QtWidgets.QWidget):
         warped_name = save_dir / f"Voronoi_warped_{ts_file}.{fmt}"
         try:
             lw = float(self.linewidth_spin.value()) if hasattr(self, 'linewidth_spin') else 0.8
-            _save_single_svg(self.polys, "Original Voronoi", orig_name, fmt=fmt, linewidth=lw)
-            _save_single_svg(warped_polys, f"Warped (s={scale:.3f}, f={freq:.2f})", warped_name, fmt=fmt, linewidth=lw)
+            _save_single_svg(self._coords, self._offsets, "Original Voronoi", orig_name, fmt=fmt, linewidth=lw)
+            _save_single_svg(warped, warped_offsets, f"Warped (s={scale:.3f}, f={freq:.2f})", warped_name, fmt=fmt, linewidth=lw)
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Save error", f"Failed to save SVGs:\n{e}")
             return
@@ -341,6 +947,31 @@ class VoronoiWidget(QtWidgets.QWidget):
             pass
 
 
+def _start_numba_threads():
+    """Start numba's parallel worker threads from the calling thread.
+
+    This must happen on the main thread before any parallel kernel runs on
+    another one: the TBB threading layer otherwise hangs the interpreter
+    at exit.
+    """
+    if HAVE_NUMBA:
+        get_num_threads()
+
+
+def _warm_up_kernels():
+    """Compile (or load from the cache) the numba kernels on a tiny input.
+
+    Runs on a background thread; it holds `_PARALLEL_LOCK` throughout, so
+    the widget's first warp waits for the kernels instead of launching a
+    parallel kernel alongside them.
+    """
+    ring = np.array([[0.2, 0.2], [1.2, 0.2], [0.5, 0.8], [0.2, 0.2]])
+    offsets = np.array([0, len(ring)])
+    with _PARALLEL_LOCK:
+        for octaves in (_DRAG_OCTAVES, 2):
+            warp_and_clip_rings(ring, offsets, octaves=octaves)
+
+
 def main():
     app = QtWidgets.QApplication(sys.argv)
     w = VoronoiWidget()